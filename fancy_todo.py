@@ -32,10 +32,11 @@ import sys
 from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
-from PySide6.QtCore import (QAbstractItemModel, QModelIndex, QPoint, Qt,
-                            QSortFilterProxyModel)
+from PySide6.QtCore import (QAbstractItemModel, QByteArray, QMimeData,
+                            QModelIndex, QPoint, QSize, QSortFilterProxyModel,
+                            Qt, QTimer)
 from PySide6.QtGui import (
     QAction,
     QColor,
@@ -43,13 +44,11 @@ from PySide6.QtGui import (
     QIcon,
     QKeySequence,
     QPalette,
-    QStandardItem,
-    QStandardItemModel,
 )
 from PySide6.QtWidgets import (QApplication, QCheckBox, QDateEdit, QDialog,
                                QDialogButtonBox, QFormLayout, QHBoxLayout,
                                QHeaderView, QLabel, QLineEdit, QListView,
-                               QMainWindow, QMessageBox, QPushButton,
+                               QMainWindow, QMenu, QMessageBox, QPushButton,
                                QSplitter, QStyle, QStyledItemDelegate,
                                QTreeView, QVBoxLayout, QWidget)
 
@@ -61,17 +60,44 @@ from PySide6.QtWidgets import (QApplication, QCheckBox, QDateEdit, QDialog,
 DB_PATH = Path(__file__).with_suffix(".sqlite")
 
 
-def _dict_factory(cursor, row):
-    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+_conn: Optional[sqlite3.Connection] = None
+
+
+def _connection() -> sqlite3.Connection:
+    """Open the process-wide connection on first use."""
+    global _conn
+    if _conn is None:
+        # Autocommit mode: transactions are issued explicitly by get_db().
+        _conn = sqlite3.connect(DB_PATH, isolation_level=None)
+        _conn.row_factory = sqlite3.Row
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        # Off by default in SQLite; needed for ON DELETE CASCADE to apply.
+        _conn.execute("PRAGMA foreign_keys=ON")
+    return _conn
 
 
 @contextmanager
-def get_db() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = _dict_factory  # type: ignore
-    yield conn
-    conn.commit()
-    conn.close()
+def get_db() -> Iterator[sqlite3.Connection]:
+    """Run the block as one transaction (one fsync) on the shared connection."""
+    conn = _connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        # SQLite may already have rolled back (e.g. SQLITE_FULL); a failed
+        # COMMIT (e.g. SQLITE_BUSY) leaves the transaction open.
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+def close_db():
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
 
 
 def init_db():
@@ -92,6 +118,46 @@ def init_db():
             );
             """
         )
+        # Lets the tree load stream rows in (parent_id, ordering) order
+        # without a sort step.
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_parent_ordering "
+            "ON tasks(parent_id, ordering)"
+        )
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_due_done "
+            "ON tasks(due, done) WHERE done = 0"
+        )
+
+
+def bulk_insert_tasks(rows: Iterable[dict]) -> int:
+    """Insert many tasks in one transaction; returns how many were inserted.
+
+    Rows need a ``title``; other columns fall back to the table defaults
+    (timestamps to now).  All rows go through one prepared ``executemany``
+    statement, and a bad row rolls back the whole batch.
+    """
+    now_iso = datetime.utcnow().isoformat()
+    params = [
+        (
+            row.get("parent_id"),
+            row["title"],
+            row.get("done", 0),
+            row.get("due"),
+            row.get("tags"),
+            row.get("ordering", 0),
+            row.get("created_at", now_iso),
+            row.get("updated_at", now_iso),
+        )
+        for row in rows
+    ]
+    with get_db() as db:
+        db.executemany(
+            "INSERT INTO tasks (parent_id, title, done, due, tags, ordering, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            params,
+        )
+    return len(params)
 
 
 # ------------------------------
@@ -99,54 +165,344 @@ def init_db():
 # ------------------------------
 
 
-class TaskItem(QStandardItem):
-    """Extends QStandardItem to store task metadata."""
+TASK_MIME_TYPE = "application/x-fancy-todo-task-ids"
+
+
+class TaskTreeModel(QAbstractItemModel):
+    """Tree model over the ``tasks`` table, one plain dict per task.
+
+    ``_rows`` maps task id -> row dict and ``_children`` maps a parent id
+    (``None`` for top-level tasks) to its ordered child ids.  Every index
+    carries its task id as ``internalId()``, so no per-row Qt objects exist.
+    """
 
     COLUMNS = ["Title", "Due", "Tags"]
 
-    def __init__(self, db_row: dict):
-        super().__init__(db_row["title"])
-        self.setEditable(False)
-        self.db_row = db_row  # Keep the full row for quick access
-        self.set_checkstate()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: dict[int, dict] = {}
+        self._children: dict[Optional[int], List[int]] = {None: []}
+        self._position: dict[int, int] = {}  # task id -> row within its parent
+        self._today = date.today().isoformat()
+        # Per-task paint caches; only the touched task's entries are dropped.
+        self._fg_cache: dict[int, tuple] = {}  # task id -> (title, due) colour
+        self._size_cache: dict[tuple, QSize] = {}  # (task id, column) -> size
 
     # --------------------------
     # Convenience helpers
     # --------------------------
 
-    def set_checkstate(self):
-        self.setCheckable(True)
-        self.setCheckState(Qt.Checked if self.db_row["done"] else Qt.Unchecked)
+    def load(self, rows: List[sqlite3.Row]):
+        """Replace the model contents; rows must carry an ``overdue`` flag."""
+        self.beginResetModel()
+        self._today = date.today().isoformat()
+        # Toggles and moves update rows in place, so keep mutable copies.
+        by_id = {row["id"]: dict(row) for row in rows}
+        children: dict[Optional[int], List[int]] = {None: []}
+        for row in rows:
+            children.setdefault(row["parent_id"], []).append(row["id"])
+
+        # Keep only tasks reachable from the top level (skips orphans).
+        self._rows = {}
+        stack: List[Optional[int]] = [None]
+        while stack:
+            for child_id in children.get(stack.pop(), []):
+                self._rows[child_id] = by_id[child_id]
+                stack.append(child_id)
+        self._children = {
+            parent_id: ids for parent_id, ids in children.items()
+            if parent_id is None or parent_id in self._rows
+        }
+        self._position = {}
+        self._fg_cache.clear()
+        self._size_cache.clear()
+        for ids in self._children.values():
+            self._reindex(ids)
+        self.endResetModel()
+
+    def _reindex(self, ids: List[int], start: int = 0):
+        for pos in range(start, len(ids)):
+            self._position[ids[pos]] = pos
+
+    @staticmethod
+    def _id(index: QModelIndex) -> Optional[int]:
+        return index.internalId() if index.isValid() else None
+
+    def task(self, index: QModelIndex) -> Optional[dict]:
+        return self._rows.get(index.internalId()) if index.isValid() else None
+
+    def task_by_id(self, task_id: int) -> Optional[dict]:
+        return self._rows.get(task_id)
+
+    def child_ids(self, task_id: Optional[int]) -> List[int]:
+        return self._children.get(task_id, [])
+
+    def has_subtasks(self) -> bool:
+        return any(ids for parent_id, ids in self._children.items() if parent_id is not None)
+
+    def task_ids(self):
+        return self._rows.keys()
+
+    def subtree_ids(self, task_id: int) -> List[int]:
+        ids = [task_id]
+        for current in ids:
+            ids.extend(self._children.get(current, []))
+        return ids
+
+    def index_for_id(self, task_id: Optional[int], column: int = 0) -> QModelIndex:
+        if task_id is None or task_id not in self._rows:
+            return QModelIndex()
+        return self.createIndex(self._position[task_id], column, task_id)
+
+    def _compute_overdue(self, row: dict) -> int:
+        # ISO dates compare correctly as strings, so no per-row parsing.
+        return int(bool(row["due"]) and not row["done"] and row["due"] < self._today)
+
+    def _foregrounds(self, row: dict) -> tuple:
+        colors = self._fg_cache.get(row["id"])
+        if colors is None:
+            overdue = row["overdue"]
+            title = QColor("gray") if row["done"] else QColor("red") if overdue else None
+            colors = (title, QColor("red") if overdue else None)
+            self._fg_cache[row["id"]] = colors
+        return colors
+
+    def _invalidate(self, task_id: int):
+        self._fg_cache.pop(task_id, None)
+        for column in range(len(self.COLUMNS)):
+            self._size_cache.pop((task_id, column), None)
+
+    def cache_size_hint(self, index: QModelIndex, size: QSize):
+        if index.isValid():
+            self._size_cache[(index.internalId(), index.column())] = size
+
+    def _is_within(self, task_id: Optional[int], ancestor_id: int) -> bool:
+        while task_id is not None:
+            if task_id == ancestor_id:
+                return True
+            task_id = self._rows[task_id]["parent_id"]
+        return False
+
+    # --------------------------
+    # QAbstractItemModel interface
+    # --------------------------
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        ids = self._children.get(self._id(parent), [])
+        if 0 <= row < len(ids) and 0 <= column < len(self.COLUMNS):
+            return self.createIndex(row, column, ids[row])
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        return self.index_for_id(self._rows[index.internalId()]["parent_id"])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._children.get(self._id(parent), []))
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
 
-    @property
-    def id(self) -> int:
-        return self.db_row["id"]
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        row = self.task(index)
+        if row is None:
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return row["title"]
+            return (row["due"] if column == 1 else row["tags"]) or ""
+        if role == Qt.CheckStateRole and column == 0:
+            return Qt.Checked if row["done"] else Qt.Unchecked
+        if role == Qt.ForegroundRole:
+            return self._foregrounds(row)[column] if column < 2 else None
+        if role == Qt.SizeHintRole:
+            return self._size_cache.get((row["id"], column))
+        return None
 
-    @property
-    def title(self) -> str:
-        return self.db_row["title"]
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole) -> bool:
+        row = self.task(index)
+        if row is None or role != Qt.CheckStateRole or index.column() != 0:
+            return False
+        new_done = 1 if Qt.CheckState(value) == Qt.Checked else 0
+        if new_done == row["done"]:
+            return True
+        now = datetime.utcnow().isoformat()
+        with get_db() as db:
+            db.execute(
+                "UPDATE tasks SET done=?, updated_at=? WHERE id=?",
+                (new_done, now, row["id"]),
+            )
+        row["done"] = new_done
+        row["updated_at"] = now
+        row["overdue"] = self._compute_overdue(row)
+        self._invalidate(row["id"])
+        # Only this row's title (check + colour) and due (overdue colour) change.
+        self.dataChanged.emit(index, index.siblingAtColumn(1), [Qt.CheckStateRole, Qt.ForegroundRole])
+        return True
 
     # --------------------------
-    # Data syncing with DB
+    # Structural changes
     # --------------------------
 
-    def refresh_from_db(self):
-        with get_db() as db:
-            row = db.execute("SELECT * FROM tasks WHERE id=?", (self.id,)).fetchone()
-            if row:
-                self.db_row = row
-                self.setText(row["title"])
-                self.set_checkstate()
-
-    def toggle_done(self):
-        new_done = 0 if self.db_row["done"] else 1
+    def append_task(self, row: dict) -> QModelIndex:
+        parent_id = row["parent_id"]
+        siblings = self._children.setdefault(parent_id, [])
+        position = len(siblings)
+        row["overdue"] = self._compute_overdue(row)
+        self.beginInsertRows(self.index_for_id(parent_id), position, position)
+        self._rows[row["id"]] = row
+        siblings.append(row["id"])
+        self._position[row["id"]] = position
+        self.endInsertRows()
+        return self.createIndex(position, 0, row["id"])
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        """Drop rows (and their subtrees) from the model; the DB is left alone."""
+        siblings = self._children.get(self._id(parent), [])
+        if row < 0 or count <= 0 or row + count > len(siblings):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        stack = siblings[row:row + count]
+        del siblings[row:row + count]
+        while stack:
+            task_id = stack.pop()
+            stack.extend(self._children.pop(task_id, []))
+            self._rows.pop(task_id, None)
+            self._position.pop(task_id, None)
+            self._invalidate(task_id)
+        self._reindex(siblings, row)
+        self.endRemoveRows()
+        return True
+
+    def move_task(self, task_id: int, new_parent_id: Optional[int], position: int) -> int:
+        """Move a task with its subtree and persist the new sibling order.
+
+        Returns the row just after the moved task, for dropping several.
+        """
+        row = self._rows.get(task_id)
+        if row is None or self._is_within(new_parent_id, task_id):
+            return position
+        old_parent_id = row["parent_id"]
+        old_position = self._position[task_id]
+        if not self.beginMoveRows(
+            self.index_for_id(old_parent_id), old_position, old_position,
+            self.index_for_id(new_parent_id), position,
+        ):
+            return old_position + 1  # dropped onto its own slot
+
+        old_siblings = self._children[old_parent_id]
+        del old_siblings[old_position]
+        if new_parent_id == old_parent_id and position > old_position:
+            position -= 1
+        new_siblings = self._children.setdefault(new_parent_id, [])
+        new_siblings.insert(position, task_id)
+        row["parent_id"] = new_parent_id
+        self._reindex(old_siblings)
+        self._reindex(new_siblings)
+        self.endMoveRows()
+
         with get_db() as db:
             db.execute(
-                "UPDATE tasks SET done=?, updated_at=? WHERE id=?",
-                (new_done, datetime.utcnow().isoformat(), self.id),
+                "UPDATE tasks SET parent_id=?, updated_at=? WHERE id=?",
+                (new_parent_id, datetime.utcnow().isoformat(), task_id),
+            )
+            db.executemany(
+                "UPDATE tasks SET ordering=? WHERE id=?",
+                [(pos, sibling_id) for pos, sibling_id in enumerate(new_siblings)],
             )
-        self.db_row["done"] = new_done
-        self.set_checkstate()
+        for pos, sibling_id in enumerate(new_siblings):
+            self._rows[sibling_id]["ordering"] = pos
+        return position + 1
+
+    # --------------------------
+    # Drag & drop
+    # --------------------------
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def mimeTypes(self) -> List[str]:
+        return [TASK_MIME_TYPE]
+
+    def mimeData(self, indexes) -> QMimeData:
+        ids = [str(index.internalId()) for index in indexes if index.column() == 0]
+        mime = QMimeData()
+        mime.setData(TASK_MIME_TYPE, QByteArray(",".join(ids).encode()))
+        return mime
+
+    def dropMimeData(self, data: QMimeData, action, row: int, column: int, parent: QModelIndex) -> bool:
+        if action != Qt.MoveAction or not data.hasFormat(TASK_MIME_TYPE):
+            return False
+        new_parent_id = self._id(parent)
+        # Not rowCount(parent): that is 0 when dropped on a Due/Tags cell.
+        position = row if row >= 0 else len(self.child_ids(new_parent_id))
+        for task_id in bytes(data.data(TASK_MIME_TYPE)).decode().split(","):
+            if task_id:
+                position = self.move_task(int(task_id), new_parent_id, position)
+        # The move already happened above.  Reporting the drop as handled
+        # would make QTreeView call removeRows() on the source rows as well.
+        return False
+
+
+# ------------------------------
+# Search index
+# ------------------------------
+
+
+class TitleIndex:
+    """Lower-cased task titles for substring search.
+
+    A substring test per title runs in C and stays well under a millisecond
+    for thousands of tasks, so no extra lookup structure is built.
+    """
+
+    def __init__(self):
+        self._titles: dict[int, str] = {}
+
+    def clear(self):
+        self._titles.clear()
+
+    def add(self, task_id: int, title: str):
+        self._titles[task_id] = title.lower()
+
+    def remove(self, task_id: int):
+        self._titles.pop(task_id, None)
+
+    def search(self, query: str) -> set[int]:
+        """Ids of tasks whose lower-cased title contains ``query``."""
+        return {task_id for task_id, title in self._titles.items() if query in title}
+
+
+class TaskDelegate(QStyledItemDelegate):
+    """Measures each cell once and hands the size to the model's cache.
+
+    QStyledItemDelegate already returns ``Qt.SizeHintRole`` data when the
+    model has it, so only the first paint of a cell pays for text metrics.
+    """
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        size = super().sizeHint(option, index)
+        model = index.model()
+        if isinstance(model, TaskTreeModel):
+            model.cache_size_hint(index, size)
+        return size
 
 
 # ------------------------------
@@ -207,33 +563,50 @@ class TaskDialog(QDialog):
 
 
 class MainWindow(QMainWindow):
+    FILTER_DELAY_MS = 120
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Fancy To‑Do (local)")
         self.resize(800, 600)
 
-        self.model = QStandardItemModel()
-        self.model.setHorizontalHeaderLabels(TaskItem.COLUMNS)
+        self.model = TaskTreeModel(self)
 
         self.tree = QTreeView()
         self.tree.setModel(self.model)
+        self.tree.setItemDelegate(TaskDelegate(self.tree))
         self.tree.setHeaderHidden(False)
         self.tree.setDragDropMode(QTreeView.InternalMove)
         self.tree.setEditTriggers(QTreeView.NoEditTriggers)
         self.tree.setSelectionBehavior(QTreeView.SelectRows)
         self.tree.setUniformRowHeights(True)
+        self.tree.setItemsExpandable(True)
         self.tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
 
         # Search bar
+        self._last_filter = ""
+        self._hidden: set[int] = set()  # task ids hidden by the search
+        self._title_index = TitleIndex()
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search…")
-        self.search_bar.textChanged.connect(self._filter_tasks)
+        self.search_bar.textChanged.connect(self._queue_filter)
+
+        # Coalesce keystrokes: filter once typing pauses for FILTER_DELAY_MS
+        self._pending_filter = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_pending_filter)
+
+        # Icons are looked up once and shared by the buttons and context menu
+        self._icon_new = self.style().standardIcon(QStyle.SP_FileDialogNewFolder)
+        self._icon_delete = self.style().standardIcon(QStyle.SP_TrashIcon)
 
         # Buttons
-        add_btn = QPushButton(self.style().standardIcon(QStyle.SP_FileDialogNewFolder), "Add")
+        add_btn = QPushButton(self._icon_new, "Add")
         add_btn.clicked.connect(self.add_task)
 
-        del_btn = QPushButton(self.style().standardIcon(QStyle.SP_TrashIcon), "Delete")
+        del_btn = QPushButton(self._icon_delete, "Delete")
         del_btn.clicked.connect(self.delete_task)
 
         top_bar = QHBoxLayout()
@@ -257,13 +630,20 @@ class MainWindow(QMainWindow):
             triggered=self.delete_task,
         )
 
-        # Context menu
+        # Drag-and-drop can turn a flat list into a tree and back
+        self.model.rowsMoved.connect(self._on_rows_moved)
+
+        # Context menu (built once, re-shown on every right-click)
+        self._context_menu = QMenu(self)
+        self._context_menu.addAction(
+            QAction(self._icon_new, "Add Sub‑task", self, triggered=self.add_task)
+        )
+        self._context_menu.addAction(
+            QAction(self._icon_delete, "Delete", self, triggered=self.delete_task)
+        )
         self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self._show_context_menu)
 
-        # Model interactions
-        self.model.itemChanged.connect(self._on_item_changed)
-
         self.load_tasks()
 
     # --------------------------
@@ -271,74 +651,66 @@ class MainWindow(QMainWindow):
     # --------------------------
 
     def load_tasks(self):
-        self.model.removeRows(0, self.model.rowCount())
-
         with get_db() as db:
             rows = db.execute(
-                "SELECT * FROM tasks ORDER BY parent_id NULLS FIRST, ordering"
+                "SELECT *, (due IS NOT NULL AND done = 0 AND due < date('now', 'localtime')) AS overdue "
+                "FROM tasks ORDER BY parent_id NULLS FIRST, ordering, id"
             ).fetchall()
 
-        item_map: dict[int, TaskItem] = {}
-        root_items: List[TaskItem] = []
-
-        for row in rows:
-            item = TaskItem(row)
-
-            # Additional columns
-            due_item = QStandardItem(row["due"] or "")
-            tags_item = QStandardItem(row["tags"] or "")
+        # One model reset, so the view lays itself out once per load.
+        self.model.load(rows)
+        # A flat list needs no branch indicators or expansion bookkeeping.
+        has_subtasks = self.model.has_subtasks()
+        self.tree.setRootIsDecorated(has_subtasks)
+        if has_subtasks:
+            self.tree.expandAll()
 
-            # Overdue highlight
-            if row["due"] and not row["done"] and date.fromisoformat(row["due"]) < date.today():
-                for col in (item, due_item):
-                    col.setForeground(QColor("red"))
+        self._title_index.clear()
+        for task_id in self.model.task_ids():
+            self._title_index.add(task_id, self.model.task_by_id(task_id)["title"])
 
-            if row["done"]:
-                item.setForeground(QColor("gray"))
-
-            if row["parent_id"]:
-                parent = item_map.get(row["parent_id"])
-                if parent:
-                    parent.appendRow([item, due_item, tags_item])
-            else:
-                root_items.append(item)
-                self.model.appendRow([item, due_item, tags_item])
-
-            item_map[row["id"]] = item
-        self.tree.expandAll()
+        # The reset un-hides every row; re-apply the current search.
+        self._last_filter = ""
+        self._hidden = set()
+        self._filter_tasks(self.search_bar.text())
 
     # --------------------------
     # Helpers
     # --------------------------
 
-    def _selected_item(self) -> Optional[TaskItem]:
+    def _on_rows_moved(self, parent, start, end, destination: QModelIndex, row):
+        self.tree.setRootIsDecorated(self.model.has_subtasks())
+
+    def _selected_index(self) -> QModelIndex:
         idxs = self.tree.selectionModel().selectedRows()
-        if idxs:
-            return self.model.itemFromIndex(idxs[0])  # type: ignore
-        return None
+        return idxs[0] if idxs else QModelIndex()
 
     # --------------------------
     # Actions
     # --------------------------
 
     def add_task(self):
-        parent_item = self._selected_item()
+        parent_task = self.model.task(self._selected_index())
         dialog = TaskDialog(self)
         if dialog.exec() == QDialog.Accepted:
             data = dialog.get_data()
             if not data["title"]:
                 return
+            parent_id = parent_task["id"] if parent_task else None
+            ordering = len(self.model.child_ids(parent_id))
+            now_iso = datetime.utcnow().isoformat()
             with get_db() as db:
                 cursor = db.execute(
-                    "INSERT INTO tasks (parent_id, title, due, tags, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    "INSERT INTO tasks (parent_id, title, due, tags, ordering, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
                     (
-                        parent_item.id if parent_item else None,
+                        parent_id,
                         data["title"],
                         data["due"],
                         data["tags"],
-                        datetime.utcnow().isoformat(),
-                        datetime.utcnow().isoformat(),
+                        ordering,
+                        now_iso,
+                        now_iso,
                     ),
                 )
                 new_id = cursor.lastrowid
@@ -346,68 +718,84 @@ class MainWindow(QMainWindow):
             # Insert into model directly
             row = {
                 "id": new_id,
-                "parent_id": parent_item.id if parent_item else None,
+                "parent_id": parent_id,
                 "title": data["title"],
                 "done": 0,
                 "due": data["due"],
                 "tags": data["tags"],
-                "ordering": 0,
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
+                "ordering": ordering,
+                "created_at": now_iso,
+                "updated_at": now_iso,
             }
-            item = TaskItem(row)
-            due_item = QStandardItem(row["due"] or "")
-            tags_item = QStandardItem(row["tags"] or "")
-
-            if parent_item:
-                parent_item.appendRow([item, due_item, tags_item])
-                parent_item.setExpanded(True)
-            else:
-                self.model.appendRow([item, due_item, tags_item])
+            self.model.append_task(row)
+            self._title_index.add(new_id, row["title"])
+            if parent_id is not None:
+                self.tree.setRootIsDecorated(True)
+                self.tree.expand(self.model.index_for_id(parent_id))
 
     def delete_task(self):
-        item = self._selected_item()
-        if not item:
+        idx = self._selected_index()
+        task = self.model.task(idx)
+        if not task:
             return
         reply = QMessageBox.question(
             self,
             "Delete Task",
-            f"Delete '{item.title}' and all its subtasks?",
+            f"Delete '{task['title']}' and all its subtasks?",
             QMessageBox.Yes | QMessageBox.No,
         )
         if reply == QMessageBox.Yes:
             with get_db() as db:
-                db.execute("DELETE FROM tasks WHERE id=?", (item.id,))
-            self.model.removeRow(item.row(), item.parent().index() if item.parent() else QModelIndex())
-
-    def _on_item_changed(self, itm: QStandardItem):
-        # Checkbox toggled
-        if isinstance(itm, TaskItem):
-            itm.toggle_done()
-            self.load_tasks()  # quick refresh for visuals
+                # Whole subtree in one statement, independent of FK cascades
+                db.execute(
+                    "WITH RECURSIVE subtree(id) AS ("
+                    " SELECT ? UNION ALL"
+                    " SELECT t.id FROM tasks t JOIN subtree ON t.parent_id = subtree.id"
+                    ") DELETE FROM tasks WHERE id IN subtree",
+                    (task["id"],),
+                )
+            for task_id in self.model.subtree_ids(task["id"]):
+                self._title_index.remove(task_id)
+                self._hidden.discard(task_id)
+            self.model.removeRow(idx.row(), idx.parent())
+            self.tree.setRootIsDecorated(self.model.has_subtasks())
 
     # --------------------------
     # Search filter
     # --------------------------
 
+    def _queue_filter(self, text: str):
+        self._pending_filter = text
+        self._filter_timer.start()  # restarts if already running
+
+    def _apply_pending_filter(self):
+        self._filter_tasks(self._pending_filter)
+
     def _filter_tasks(self, text: str):
         text = text.lower().strip()
-        root_count = self.model.rowCount()
-        for row in range(root_count):
-            self._filter_recursive(self.model.item(row, 0), text)
-
-    def _filter_recursive(self, itm: TaskItem, text: str) -> bool:
-        """Returns True if item or any child matches."""
-        child_match = False
-        for i in range(itm.rowCount()):
-            child = itm.child(i, 0)
-            if self._filter_recursive(child, text):
-                child_match = True
-
-        is_match = text in itm.title.lower()
-        visible = is_match or child_match or text == ""
-        self.tree.setRowHidden(itm.row(), itm.parent().index() if itm.parent() else QModelIndex(), not visible)
-        return visible
+        if text == self._last_filter:
+            return
+        self._last_filter = text
+
+        hidden: set[int] = set()
+        if text:
+            shown: set[int] = set()
+            for task_id in self._title_index.search(text):
+                # Matches keep their ancestors visible; stop at one already seen.
+                while task_id is not None and task_id not in shown:
+                    shown.add(task_id)
+                    task_id = self.model.task_by_id(task_id)["parent_id"]
+            hidden = self.model.task_ids() - shown
+
+        # Only touch rows whose visibility differs from the previous query.
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for task_id in hidden ^ self._hidden:
+                idx = self.model.index_for_id(task_id)
+                self.tree.setRowHidden(idx.row(), idx.parent(), task_id in hidden)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+        self._hidden = hidden
 
     # --------------------------
     # Context menu
@@ -417,14 +805,7 @@ class MainWindow(QMainWindow):
         idx = self.tree.indexAt(point)
         if not idx.isValid():
             return
-        item = self.model.itemFromIndex(idx)  # type: ignore
-        menu = self.tree.createStandardContextMenu()
-        menu.addSeparator()
-        new_action = QAction("Add Sub‑task", self, triggered=self.add_task)
-        del_action = QAction("Delete", self, triggered=self.delete_task)
-        menu.addAction(new_action)
-        menu.addAction(del_action)
-        menu.exec(QCursor.pos())
+        self._context_menu.exec(QCursor.pos())
 
 
 # ------------------------------
@@ -443,7 +824,9 @@ def main():
 
     win = MainWindow()
     win.show()
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    close_db()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
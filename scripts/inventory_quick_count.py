@@ -1,32 +1,86 @@
 #!/usr/bin/env python3
-"""Loads master_inventory.xlsx, totals each item, and prints low-stock alerts."""
+"""Loads master_inventory.xlsx, totals each item, and prints low-stock alerts.
 
+The parsed sheet is cached next to the workbook as master_inventory.parquet
+and reused until the workbook is modified again.
+
+Optional speed-ups:
+    python -m pip install python-calamine   # faster .xlsx reading (pandas >= 2.2)
+    python -m pip install pyarrow           # enables the Parquet cache
+Without them the script reads the workbook with openpyxl on every run.
+"""
+
+import importlib.util
 import os
 import sys
 
 import pandas as pd
 
+COLUMNS = ["ItemName", "Qty", "ReorderPoint"]
+# The Parquet cache needs pyarrow; without it the cache is simply skipped.
+HAVE_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def read_workbook(inventory_file):
+    """Read the needed columns, preferring the fast calamine engine if installed."""
+    try:
+        return pd.read_excel(inventory_file, engine="calamine", usecols=COLUMNS)
+    except ImportError:
+        pass  # python-calamine not installed
+    except ValueError as e:
+        if "calamine" not in str(e):
+            raise
+        # pandas older than 2.2 does not know the engine
+    return pd.read_excel(inventory_file, usecols=COLUMNS)
+
+
+def load_inventory(inventory_file, cache_file):
+    """Return the inventory columns, from the Parquet cache when it is fresh.
+
+    The cache is rewritten whenever the workbook has to be parsed.
+    """
+    if not HAVE_PYARROW:
+        return read_workbook(inventory_file)
+
+    if os.path.isfile(cache_file) and os.path.getmtime(cache_file) > os.path.getmtime(inventory_file):
+        try:
+            return pd.read_parquet(cache_file, engine="pyarrow", columns=COLUMNS)
+        except Exception as e:
+            print(f"Warning: ignoring cache '{cache_file}': {e}", file=sys.stderr)
+
+    df = read_workbook(inventory_file)
+    try:
+        df.to_parquet(cache_file, engine="pyarrow", index=False)
+    except Exception as e:
+        print(f"Warning: could not write cache '{cache_file}': {e}", file=sys.stderr)
+    return df
+
+
 def main():
     inventory_file = "master_inventory.xlsx"
+    cache_file = "master_inventory.parquet"
     if not os.path.isfile(inventory_file):
         print(f"Error: '{inventory_file}' not found.", file=sys.stderr)
         sys.exit(1)
 
     try:
-        df = pd.read_excel(inventory_file)
+        df = load_inventory(inventory_file, cache_file)
     except Exception as e:
         print(f"Error reading '{inventory_file}': {e}", file=sys.stderr)
         sys.exit(1)
 
     # Expect columns: ItemName, Qty, ReorderPoint
     grouped = df.groupby("ItemName").agg({"Qty": "sum", "ReorderPoint": "first"})
+    grouped["Alert"] = grouped["Qty"] < grouped["ReorderPoint"]
 
-    for item, row in grouped.iterrows():
-        qty = row["Qty"]
-        reorder = row["ReorderPoint"]
-        print(f"{item}: Total Qty = {qty}")
-        if qty < reorder:
-            print(f"ALERT: '{item}' is below reorder point ({qty} < {reorder})")
+    # Build the whole report first and write it in one go
+    lines = []
+    for item, qty, reorder, alert in grouped.itertuples(index=True, name=None):
+        lines.append(f"{item}: Total Qty = {qty}")
+        if alert:
+            lines.append(f"ALERT: '{item}' is below reorder point ({qty} < {reorder})")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
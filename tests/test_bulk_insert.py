@@ -0,0 +1,59 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+import fancy_todo  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    fancy_todo.close_db()
+    monkeypatch.setattr(fancy_todo, "DB_PATH", tmp_path / "tasks.sqlite")
+    fancy_todo.init_db()
+    yield fancy_todo.get_db
+    fancy_todo.close_db()
+
+
+def _count(get_db):
+    with get_db() as conn:
+        return conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+
+def test_defaults(db):
+    assert fancy_todo.bulk_insert_tasks([{"title": "Order planks"}]) == 1
+    with db() as conn:
+        row = conn.execute("SELECT * FROM tasks").fetchone()
+    assert row["title"] == "Order planks"
+    assert row["parent_id"] is None
+    assert row["done"] == 0
+    assert row["due"] is None
+    assert row["tags"] is None
+    assert row["ordering"] == 0
+    assert row["created_at"] == row["updated_at"]
+
+
+def test_explicit_columns_are_kept(db):
+    fancy_todo.bulk_insert_tasks(
+        [{"title": "Check couplers", "done": 1, "due": "2030-01-02", "tags": "yard", "ordering": 4}]
+    )
+    with db() as conn:
+        row = conn.execute("SELECT done, due, tags, ordering FROM tasks").fetchone()
+    assert tuple(row) == (1, "2030-01-02", "yard", 4)
+
+
+@pytest.mark.parametrize("n", [0, 1, 1203])
+def test_row_counts(db, n):
+    rows = ({"title": f"task {i}", "ordering": i} for i in range(n))
+    assert fancy_todo.bulk_insert_tasks(rows) == n
+    assert _count(db) == n
+
+
+def test_bad_row_rolls_back_batch(db):
+    rows = [{"title": "ok"}] * 10 + [{"title": None}]
+    with pytest.raises(sqlite3.IntegrityError):
+        fancy_todo.bulk_insert_tasks(rows)
+    assert _count(db) == 0
+    # The shared connection is usable again afterwards.
+    assert fancy_todo.bulk_insert_tasks([{"title": "after"}]) == 1
@@ -0,0 +1,116 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+import fancy_todo  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(qapp, tmp_path, monkeypatch):
+    """MainWindow over a fresh DB holding  1 > (2, 3)  and  4."""
+    fancy_todo.close_db()
+    monkeypatch.setattr(fancy_todo, "DB_PATH", tmp_path / "tasks.sqlite")
+    fancy_todo.init_db()
+    fancy_todo.bulk_insert_tasks(
+        [
+            {"title": "Yard", "ordering": 0},
+            {"title": "Stack planks", "parent_id": 1, "ordering": 0},
+            {"title": "Count couplers", "parent_id": 1, "ordering": 1},
+            {"title": "Invoices", "ordering": 1},
+        ]
+    )
+    win = fancy_todo.MainWindow()
+    yield win
+    win.close()
+    win.deleteLater()
+    fancy_todo.close_db()
+
+
+def _db_row(task_id):
+    with fancy_todo.get_db() as db:
+        return db.execute("SELECT * FROM tasks WHERE id=?", (task_id,)).fetchone()
+
+
+def _drop(model, task_id, row, parent):
+    mime = model.mimeData([model.index_for_id(task_id)])
+    return model.dropMimeData(mime, Qt.MoveAction, row, 0, parent)
+
+
+def test_main_window_loads_tree(window):
+    model = window.model
+    assert model.child_ids(None) == [1, 4]
+    assert model.child_ids(1) == [2, 3]
+    assert model.rowCount() == 2
+    assert model.rowCount(model.index_for_id(1)) == 2
+    assert model.data(model.index_for_id(3)) == "Count couplers"
+    assert window.tree.rootIsDecorated()
+
+
+def test_set_check_state_persists_done(window):
+    model = window.model
+    idx = model.index_for_id(2)
+    assert model.setData(idx, Qt.Checked, Qt.CheckStateRole)
+    assert _db_row(2)["done"] == 1
+    assert model.data(idx, Qt.CheckStateRole) == Qt.Checked
+    assert model.data(idx, Qt.ForegroundRole).name() == "#808080"
+
+    assert model.setData(idx, Qt.Unchecked, Qt.CheckStateRole)
+    assert _db_row(2)["done"] == 0
+
+
+def test_drop_onto_task_reparents_and_persists(window):
+    model = window.model
+    # The view must not remove the source rows, so the drop reports False.
+    assert _drop(model, 4, -1, model.index_for_id(1)) is False
+    assert model.child_ids(None) == [1]
+    assert model.child_ids(1) == [2, 3, 4]
+    assert _db_row(4)["parent_id"] == 1
+    assert [_db_row(i)["ordering"] for i in (2, 3, 4)] == [0, 1, 2]
+
+
+def test_drop_onto_due_cell_appends(window):
+    model = window.model
+    _drop(model, 4, -1, model.index_for_id(1, column=1))
+    assert model.child_ids(1) == [2, 3, 4]
+
+
+def test_drop_between_rows_reorders(window):
+    model = window.model
+    _drop(model, 3, 0, model.index_for_id(1))
+    assert model.child_ids(1) == [3, 2]
+    assert (_db_row(3)["ordering"], _db_row(2)["ordering"]) == (0, 1)
+
+    _drop(model, 2, 0, fancy_todo.QModelIndex())
+    assert model.child_ids(None) == [2, 1, 4]
+    assert _db_row(2)["parent_id"] is None
+
+
+def test_drop_into_own_subtree_is_refused(window):
+    model = window.model
+    _drop(model, 1, -1, model.index_for_id(2))
+    _drop(model, 1, -1, model.index_for_id(1))
+    assert model.child_ids(None) == [1, 4]
+    assert model.child_ids(1) == [2, 3]
+    assert _db_row(1)["parent_id"] is None
+
+
+def test_remove_rows_drops_subtree(window):
+    model = window.model
+    assert model.removeRows(0, 1)
+    assert model.child_ids(None) == [4]
+    assert model.task_by_id(1) is None
+    assert model.task_by_id(2) is None
+    assert model.task_by_id(3) is None
+    assert model.index_for_id(4).row() == 0
+    assert not model.removeRows(1, 1)
@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from fancy_todo import TitleIndex  # noqa: E402
+
+TITLES = {
+    1: "Buy Groceries",
+    2: "groceries list for the week",
+    3: "Call the scaffolding supplier about the Tuesday delivery",
+    4: "",
+    5: "ÉTÉ inventory check",
+}
+
+
+def _scan(titles, query):
+    return {task_id for task_id, title in titles.items() if query in title.lower()}
+
+
+@pytest.fixture
+def index():
+    idx = TitleIndex()
+    for task_id, title in TITLES.items():
+        idx.add(task_id, title)
+    return idx
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "g",
+        "roc",
+        "groceries",
+        "zz",
+        "été",
+        "call the scaffolding supplier about the tuesday",
+        "call the scaffolding supplier about the wednesday",
+    ],
+)
+def test_search_matches_substring_scan(index, query):
+    assert index.search(query) == _scan(TITLES, query)
+
+
+def test_remove_and_clear(index):
+    index.remove(2)
+    index.remove(99)  # unknown ids are ignored
+    assert index.search("groceries") == {1}
+    index.clear()
+    assert index.search("") == set()